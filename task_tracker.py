@@ -1,19 +1,110 @@
+import os
 import sys
 import json
-import uuid
+import math
+import itertools
+import threading
+
+try:
+    import orjson  # C-accelerated encoder, ~3-10x faster than stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+# Only the widgets needed to put the main window on screen are imported at
+# startup; dialog-only widgets are imported lazily when a dialog first opens.
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QGraphicsView, QGraphicsScene, QGraphicsItem,
-    QGraphicsTextItem, QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QTextEdit,
-    QPushButton, QColorDialog, QFormLayout, QDateEdit, QComboBox, QMessageBox,
-    QGraphicsProxyWidget, QStyleOptionGraphicsItem, QWidget, QMenu, QGraphicsEllipseItem, QGraphicsLineItem
+    QGraphicsTextItem, QDialog, QPushButton, QMenu, QGraphicsEllipseItem,
+    QGraphicsLineItem, QGraphicsPolygonItem, QGraphicsItemGroup
 )
-from PyQt6.QtCore import Qt, QPointF, QRectF, QDate, QLineF
-from PyQt6.QtGui import QColor, QBrush, QPen, QPainter, QPainterPath, QFont
+from PyQt6.QtCore import (
+    Qt, QPointF, QRectF, QDate, QLineF, QTimer, QObject, QThread, QMetaObject,
+    pyqtSlot
+)
+from PyQt6.QtGui import QColor, QBrush, QPen, QPainter, QPainterPath, QFont, QPixmap, QPolygonF
 
 # --- CONFIGURATION ---
 SAVE_FILE = 'tasks.json'
 DEFAULT_NODE_COLOR = '#ffc107'  # A nice amber color
 
+_ARROW_WING_RAD = math.radians(155)
+
+def _arrow_geometry(sx, sy, ex, ey, size):
+    """Returns the arrowhead wing points for a line from (sx, sy) to (ex, ey).
+
+    Pure float math (no Qt objects) so numba can JIT-compile it when
+    installed; the pure-Python version is the fallback.
+    """
+    angle = math.atan2(sy - ey, ex - sx)  # scene y grows downward
+    w1 = angle + _ARROW_WING_RAD
+    w2 = angle - _ARROW_WING_RAD
+    return (ex + size * math.cos(w1), ey - size * math.sin(w1),
+            ex + size * math.cos(w2), ey - size * math.sin(w2))
+
+if njit is not None:
+    _arrow_geometry = njit(cache=True)(_arrow_geometry)
+
+class NodeGridIndex:
+    """Uniform-grid spatial index over node bounding boxes.
+
+    A hand-rolled stand-in for an R-tree: each node is bucketed into the
+    grid cells its box overlaps, so rectangle queries touch only nearby
+    buckets instead of scanning every node.
+    """
+    def __init__(self, cell_size=256):
+        self.cell_size = cell_size
+        self._cells = {}   # (cx, cy) -> set of task_id
+        self._extents = {} # task_id -> (x1, y1, x2, y2)
+
+    def _cells_for(self, x1, y1, x2, y2):
+        cs = self.cell_size
+        for cx in range(int(x1 // cs), int(x2 // cs) + 1):
+            for cy in range(int(y1 // cs), int(y2 // cs) + 1):
+                yield (cx, cy)
+
+    def insert(self, task_id, x1, y1, x2, y2):
+        """Inserts or moves a node's bounding box."""
+        self.remove(task_id)
+        self._extents[task_id] = (x1, y1, x2, y2)
+        for key in self._cells_for(x1, y1, x2, y2):
+            self._cells.setdefault(key, set()).add(task_id)
+
+    def remove(self, task_id):
+        extent = self._extents.pop(task_id, None)
+        if extent is None:
+            return
+        for key in self._cells_for(*extent):
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.discard(task_id)
+                if not bucket:
+                    del self._cells[key]
+
+    def bounds(self):
+        """Returns (x1, y1, x2, y2) covering all indexed boxes, or None if empty."""
+        if not self._extents:
+            return None
+        extents = self._extents.values()
+        return (min(e[0] for e in extents), min(e[1] for e in extents),
+                max(e[2] for e in extents), max(e[3] for e in extents))
+
+    def query(self, x1, y1, x2, y2):
+        """Yields ids of nodes whose boxes intersect the given rect."""
+        seen = set()
+        for key in self._cells_for(x1, y1, x2, y2):
+            for task_id in self._cells.get(key, ()):
+                if task_id in seen:
+                    continue
+                seen.add(task_id)
+                ex1, ey1, ex2, ey2 = self._extents[task_id]
+                if ex1 <= x2 and ex2 >= x1 and ey1 <= y2 and ey2 >= y1:
+                    yield task_id
+
+
 class PortItem(QGraphicsEllipseItem):
     """Small draggable connection point on a TaskNode edge."""
     def __init__(self, parent_node, edge, main_window):
@@ -68,13 +159,25 @@ class TaskNode(QGraphicsItem):
     """
     Represents a draggable, editable task node in the graphics scene.
     """
+    TITLE_FONT = QFont("Inter", 10, QFont.Weight.Bold)
+    DETAILS_FONT = QFont("Inter", 8)
+    SELECTED_PEN = QPen(Qt.GlobalColor.darkBlue, 3, Qt.PenStyle.DotLine)
+    NORMAL_PEN = QPen(Qt.GlobalColor.black, 1)
+
     def __init__(self, task_data, main_window):
         super().__init__()
         self.task_data = task_data
         self.main_window = main_window
         self.width = 200
         self.height = 80
-        self.lines = [] # To store connected lines
+        self.lines = set() # To store connected lines
+        self._dragging = False
+        self._line_update_pending = False
+        self._color_name = None
+        self._brush = QBrush()
+        # The node outline never changes size, so build the path once
+        self._path = QPainterPath()
+        self._path.addRoundedRect(0, 0, self.width, self.height, 10, 10)
 
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsMovable |
@@ -88,12 +191,19 @@ class TaskNode(QGraphicsItem):
         pos = self.task_data.get('pos', [10, 10])
         self.setPos(QPointF(pos[0], pos[1]))
         
-        # Create text items as children
+        # Create text items as children; fonts and positions are constant,
+        # so they are set once here rather than on every update_display
         self.title = QGraphicsTextItem(self)
         self.title.setDefaultTextColor(Qt.GlobalColor.black)
-        
+        self.title.setFont(self.TITLE_FONT)
+        self.title.setPos(10, 5)
+        self._last_title = None
+
         self.details = QGraphicsTextItem(self)
         self.details.setDefaultTextColor(QColor("#495057")) # A dark gray
+        self.details.setFont(self.DETAILS_FONT)
+        self.details.setPos(10, 35)
+        self._last_details = None
 
         
 
@@ -112,46 +222,49 @@ class TaskNode(QGraphicsItem):
 
     def paint(self, painter, option, widget=None):
         """Paints the node's appearance."""
-        path = QPainterPath()
-        path.addRoundedRect(self.boundingRect(), 10, 10)
+        painter.setBrush(self._brush)
 
-        # Set color
-        color = QColor(self.task_data.get('color', DEFAULT_NODE_COLOR))
-        painter.setBrush(QBrush(color))
-        
         # Add a border if selected
         if self.isSelected():
-            pen = QPen(Qt.GlobalColor.darkBlue, 3)
-            pen.setStyle(Qt.PenStyle.DotLine)
-            painter.setPen(pen)
+            painter.setPen(self.SELECTED_PEN)
         else:
-            painter.setPen(QPen(Qt.GlobalColor.black, 1))
+            painter.setPen(self.NORMAL_PEN)
 
-        painter.drawPath(path)
+        painter.drawPath(self._path)
         
     def update_display(self):
-        """Updates the text and tooltip based on task_data."""
-        # --- Title ---
-        font = QFont("Inter", 10, QFont.Weight.Bold)
-        self.title.setFont(font)
-        self.title.setPlainText(self.task_data['title'])
-        self.title.setPos(10, 5)
-        
+        """Updates the text, colors and tooltip based on task_data."""
+        # --- Fill color (rebuild the brush only when the color changes) ---
+        color_name = self.task_data.get('color', DEFAULT_NODE_COLOR)
+        if color_name != self._color_name:
+            self._color_name = color_name
+            self._brush = QBrush(QColor(color_name))
+
+        # --- Title (setPlainText rebuilds the text layout, so skip no-ops) ---
+        new_title = self.task_data['title']
+        if new_title != self._last_title:
+            self.title.setPlainText(new_title)
+            self._last_title = new_title
+
         # --- Dates ---
-        details_font = QFont("Inter", 8)
-        self.details.setFont(details_font)
-        
         created_str = self.task_data.get('created_date', 'N/A')
         due_str = self.task_data.get('due_date', 'N/A')
-        
+
         details_text = f"Created: {created_str}\nDue:       {due_str}"
-        self.details.setPlainText(details_text)
-        self.details.setPos(10, 35)
+        if details_text != self._last_details:
+            self.details.setPlainText(details_text)
+            self._last_details = details_text
 
         # --- Tooltip ---
         self.setToolTip(f"Description: {self.task_data.get('description', 'N/A')}\n"
                         f"Category: {self.task_data.get('category', 'N/A')}")
 
+    def set_text_visible(self, visible):
+        """Shows or hides the text children for level-of-detail rendering."""
+        if self.title.isVisible() != visible:
+            self.title.setVisible(visible)
+            self.details.setVisible(visible)
+
     def update_ports(self):
         """Repositions ports on edges of the node."""
         rect = self.boundingRect()
@@ -162,15 +275,11 @@ class TaskNode(QGraphicsItem):
     
     def add_line(self, line):
         """Registers a connection line with this node."""
-        if line not in self.lines:
-            self.lines.append(line)
+        self.lines.add(line)
 
     def remove_line(self, line):
         """Unregisters a connection line."""
-        try:
-            self.lines.remove(line)
-        except ValueError:
-            pass # Line not found
+        self.lines.discard(line)
 
     def itemChange(self, change, value):
         """Called when the item's state changes, e.g., it's moved."""
@@ -178,11 +287,42 @@ class TaskNode(QGraphicsItem):
             self.task_data['pos'] = [self.pos().x(), self.pos().y()]
             if hasattr(self, "ports"):  # <-- only update if ports exist
                 self.update_ports()
-                for line in self.lines:
-                    line.update_position()
-            self.main_window.save_data()
+                if self._dragging:
+                    # Mid-drag, coalesce the line fanout to once per
+                    # event-loop pass instead of once per move event.
+                    if not self._line_update_pending:
+                        self._line_update_pending = True
+                        QTimer.singleShot(0, self._flush_line_updates)
+                else:
+                    for line in self.lines:
+                        line.update_position()
+                # Guarded by the ports check above: itemChange also fires for
+                # the setPos in __init__, before the text children exist that
+                # index_node's LOD update touches.
+                if not self._dragging:
+                    self.main_window.index_node(self)
+                    self.main_window.save_data()
         return super().itemChange(change, value)
 
+    def _flush_line_updates(self):
+        """Pushes the latest position to all incident connection lines."""
+        self._line_update_pending = False
+        for line in self.lines:
+            line.update_position()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._dragging = True
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if self._dragging:
+            self._dragging = False
+            self._flush_line_updates()
+            self.main_window.index_node(self)
+            self.main_window.save_data()
+
     def mouseDoubleClickEvent(self, event):
         """Opens the detail editor on double-click."""
         dialog = TaskDialog(self.task_data, self.parentWidget())
@@ -198,8 +338,16 @@ class TaskNode(QGraphicsItem):
         super().mouseDoubleClickEvent(event)
 
 
-class ConnectionLine(QGraphicsItem):
-    """A line that connects two TaskNodes."""
+class ConnectionLine(QGraphicsItemGroup):
+    """A line with an arrowhead that connects two TaskNodes.
+
+    Composed of built-in line/polygon items so painting, boundingRect and
+    shape all run in Qt's C++ implementation rather than Python overrides.
+    """
+    LINE_PEN = QPen(Qt.GlobalColor.black, 2, Qt.PenStyle.SolidLine,
+                    Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+    ARROW_BRUSH = QBrush(Qt.GlobalColor.black)
+
     def __init__(self, start_node, end_node, connection_data, main_window):
         super().__init__()
         self.start_node = start_node
@@ -208,48 +356,44 @@ class ConnectionLine(QGraphicsItem):
         self.main_window = main_window
         self.arrow_size = 15
 
+        self._line_item = QGraphicsLineItem(self)
+        self._line_item.setPen(self.LINE_PEN)
+        self._line_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self._arrow_item = QGraphicsPolygonItem(self)
+        self._arrow_item.setBrush(self.ARROW_BRUSH)
+        self._arrow_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
         self.setZValue(0) # Ensure lines are drawn below nodes
         self.start_node.add_line(self)
         self.end_node.add_line(self)
         self.update_position()
 
-    def BoundingRect(self):
-        if hasattr(self, "line"):
-            return QRectF(self.line.p1(), self.line.p2()).normalized()
-        return QRectF()
-
     def shape(self):
-        path = QPainterPath()
-        path.moveTo(self.line.p1())
-        path.lineTo(self.line.p2())
+        """Hit-tests against the visible line and arrowhead.
+
+        The group default would use the full bounding rect, which for a long
+        diagonal edge makes most of an empty rectangle right-clickable.
+        Children share the group's coordinate system, so their shapes can be
+        combined directly.
+        """
+        path = self._line_item.shape()
+        path.addPath(self._arrow_item.shape())
         return path
 
-    def paint(self, painter, option, widget=None):
-        """Paints the line and arrowhead."""
-        if self.start_node is None or self.end_node is None:
-            return
-
-        pen = QPen(Qt.GlobalColor.black, 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen)
-
-        # Draw main line
-        painter.drawLine(self.line)
-
-        # Draw arrowhead
-        #angle = self.line.angle()
-        dest_arrow_p1 = self.line.p2() + QPointF(self.arrow_size * 0.707 * 2, 0)
-        dest_arrow_p2 = self.line.p2() + QPointF(self.arrow_size * 0.707 * 2, 0)
-
-        painter.setBrush(QBrush(Qt.GlobalColor.black))
-        painter.drawPolygon(QPointF(self.line.p2()), dest_arrow_p1, dest_arrow_p2)
-
     def update_position(self):
         """Recalculates the line's start and end points based on node positions."""
-        self.prepareGeometryChange()
         start_center = self.start_node.pos() + self.start_node.boundingRect().center()
         end_center = self.end_node.pos() + self.end_node.boundingRect().center()
-        self.line = QLineF(start_center, end_center)
-        self.update()
+        line = QLineF(start_center, end_center)
+
+        # The arrowhead is recomputed only when an endpoint moves
+        ax1, ay1, ax2, ay2 = _arrow_geometry(line.x1(), line.y1(),
+                                             line.x2(), line.y2(),
+                                             self.arrow_size)
+
+        self._line_item.setLine(line)
+        self._arrow_item.setPolygon(
+            QPolygonF([line.p2(), QPointF(ax1, ay1), QPointF(ax2, ay2)]))
 
     def contextMenuEvent(self, event):
         """Provides an option to delete the connection."""
@@ -270,6 +414,11 @@ class TaskDialog(QDialog):
         self.init_ui()
 
     def init_ui(self):
+        from PyQt6.QtWidgets import (
+            QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QTextEdit,
+            QDateEdit, QComboBox
+        )
+
         self.setWindowTitle("Task Details")
         self.setMinimumWidth(350)
         layout = QVBoxLayout(self)
@@ -324,12 +473,16 @@ class TaskDialog(QDialog):
         layout.addLayout(button_layout)
         
     def choose_color(self):
+        from PyQt6.QtWidgets import QColorDialog
+
         color = QColorDialog.getColor(self.current_color, self, "Select Task Color")
         if color.isValid():
             self.current_color = color
             self.color_button.setStyleSheet(f"background-color: {self.current_color.name()};")
 
     def handle_delete(self):
+        from PyQt6.QtWidgets import QMessageBox
+
         reply = QMessageBox.question(self, 'Confirm Deletion',
                                      "Are you sure you want to delete this task?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -349,33 +502,42 @@ class TaskDialog(QDialog):
 
 class FlowChartView(QGraphicsView):
     """Custom QGraphicsView to handle background drawing and mouse events."""
+    LOD_TEXT_SCALE = 0.5  # hide node text below this zoom level
+
     def __init__(self, scene, parent=None):
         super().__init__(scene, parent)
         self.main_window = parent
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+        # With many small items the dirty-region bookkeeping of the default
+        # update mode costs more than just repainting the viewport.
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Skip the 2px bounding-rect expansion Qt adds for antialiased items
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
 
         self.zoom_factor = 1.15  # scale factor per wheel step
 
-    def drawBackground(self, painter, rect):
-        """Draws a grid background."""
-        super().drawBackground(painter, rect)
+        # Pre-render one grid cell and tile it with a brush, so each repaint
+        # is a single fill instead of hundreds of Python drawLine calls.
         grid_size = 25
-        left = int(rect.left())
-        right = int(rect.right())
-        top = int(rect.top())
-        bottom = int(rect.bottom())
+        self._grid_pixmap = QPixmap(grid_size, grid_size)
+        self._grid_pixmap.fill(Qt.GlobalColor.white)
+        tile_painter = QPainter(self._grid_pixmap)
+        tile_painter.setPen(QPen(QColor(220, 220, 220), 1))
+        tile_painter.drawLine(0, grid_size - 1, grid_size - 1, grid_size - 1)
+        tile_painter.drawLine(grid_size - 1, 0, grid_size - 1, grid_size - 1)
+        tile_painter.end()
+        self._grid_brush = QBrush(self._grid_pixmap)
 
-        left_grid = left - (left % grid_size)
-        top_grid = top - (top % grid_size)
-
-        pen = QPen(QColor(220, 220, 220), 1)
-        painter.setPen(pen)
-
-        for x in range(left_grid, right, grid_size):
-            painter.drawLine(x, top, x, bottom)
-        for y in range(top_grid, bottom, grid_size):
-            painter.drawLine(left, y, right, y)
+    def drawBackground(self, painter, rect):
+        """Draws a grid background from the cached tile."""
+        painter.save()
+        # Axis-aligned single-pixel grid lines gain nothing from AA; keep it
+        # on only for node outlines and arrowheads.
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setBrushOrigin(0, 0)  # keep the tile aligned with scene coords
+        painter.fillRect(rect, self._grid_brush)
+        painter.restore()
 
     def wheelEvent(self, event):
         """Zoom in/out with Ctrl + mouse wheel."""
@@ -385,9 +547,93 @@ class FlowChartView(QGraphicsView):
             else:
                 zoom = 1 / self.zoom_factor
             self.scale(zoom, zoom)
+            self.update_label_lod()
         else:
             super().wheelEvent(event)
 
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        # Nodes entering the viewport pick up the current LOD state lazily
+        self.update_label_lod()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Growing the window can expose nodes carrying stale LOD state
+        self.update_label_lod()
+
+    def lod_text_visible(self):
+        """Returns whether node text should be shown at the current zoom."""
+        return self.transform().m11() >= self.LOD_TEXT_SCALE
+
+    def update_label_lod(self):
+        """Applies text visibility for the current zoom to nodes in view.
+
+        Only nodes intersecting the viewport are touched, found through the
+        spatial index; offscreen nodes keep stale visibility until they
+        scroll into view, which is invisible anyway.
+        """
+        index = getattr(self.main_window, '_node_index', None)
+        if index is None:
+            return
+        show = self.lod_text_visible()
+        # Clamp to the populated part of the index: far enough zoomed out,
+        # the viewport maps to tens of thousands of scene units per side and
+        # an unclamped rect would make the grid walk visit far more empty
+        # cells than there are nodes.
+        bounds = index.bounds()
+        if bounds is None:
+            return
+        rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        rect = rect.intersected(QRectF(QPointF(bounds[0], bounds[1]),
+                                       QPointF(bounds[2], bounds[3])))
+        if rect.isEmpty():
+            return
+        nodes = self.main_window.nodes
+        for task_id in index.query(rect.left(), rect.top(), rect.right(), rect.bottom()):
+            node = nodes.get(task_id)
+            if node is not None:
+                node.set_text_visible(show)
+
+class SaveWorker(QObject):
+    """Writes serialized save payloads to disk on a worker thread.
+
+    The GUI thread submits the latest snapshot via submit(); if a write is
+    already queued the pending payload is replaced rather than enqueued, so
+    the worker only ever writes the newest state.
+    """
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()       # guards _pending
+        self._write_lock = threading.Lock() # serializes the file write
+        self._pending = None
+
+    def submit(self, payload):
+        """Stores a payload for the next write; returns True if one was already queued."""
+        with self._lock:
+            queued = self._pending is not None
+            self._pending = payload
+        return queued
+
+    @pyqtSlot()
+    def save(self):
+        # The write lock makes save() safe to call from any thread: the
+        # GUI-side flush in closeEvent blocks here until an in-flight worker
+        # write finishes, instead of racing it on the same temp file.
+        # submit() only takes _lock, so normal saves never wait on the disk.
+        with self._write_lock:
+            with self._lock:
+                payload = self._pending
+                self._pending = None
+            if payload is None:
+                return
+            # Temp file + rename keeps the save atomic if we crash mid-write
+            tmp_file = self.path + ".tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_file, self.path)
+
+
 class MainWindow(QMainWindow):
     """
     The main application window.
@@ -398,11 +644,32 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
 
         self.scene = QGraphicsScene(self)
+        # A fixed sceneRect stops Qt from growing the scene and rebuilding
+        # the BSP index on every drag; depth 0 lets Qt size the tree itself.
+        self.scene.setSceneRect(-10000, -10000, 20000, 20000)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.scene.setBspTreeDepth(0)
         self.view = FlowChartView(self.scene, self)
         self.setCentralWidget(self.view)
 
         self.nodes = {} # task_id -> TaskNode instance
         self.connections = {} # conn_id -> ConnectionLine instance
+        self._conn_by_endpoints = {} # (from_id, to_id) -> conn_id
+        self._node_index = NodeGridIndex() # task_id -> bounding box, for rect queries
+        self._next_id = itertools.count(1) # reseeded past loaded ids in load_data
+
+        # Coalesce rapid save requests (e.g. during a drag) into one write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save)
+
+        # Disk writes happen off the GUI thread so a slow disk can't stall
+        # interaction
+        self._save_worker = SaveWorker(SAVE_FILE)
+        self._save_thread = QThread(self)
+        self._save_worker.moveToThread(self._save_thread)
+        self._save_thread.start()
 
         self.setup_ui()
         self.load_data()
@@ -433,12 +700,30 @@ class MainWindow(QMainWindow):
         self.add_button.move(self.width() - btn_size.width() - 20,
                              self.height() - btn_size.height() - 20)
 
+    def _new_id(self):
+        """Returns a fresh id from the monotonic counter.
+
+        Ids never leave the save file, so uuid4's entropy (os.urandom plus
+        hex formatting per id) is wasted work; uuid-style ids loaded from
+        older files remain valid strings alongside these.
+        """
+        return str(next(self._next_id))
+
+    def index_node(self, node):
+        """Records a node's current bounding box in the spatial index."""
+        x, y = node.pos().x(), node.pos().y()
+        self._node_index.insert(node.task_data['id'],
+                                x, y, x + node.width, y + node.height)
+        # New and moved nodes adopt the current zoom's LOD state immediately
+        # rather than waiting for the next scroll to reach them
+        node.set_text_visible(self.view.lod_text_visible())
+
     def add_task(self):
         """Opens a dialog to create a new task and adds it to the scene."""
         dialog = TaskDialog(parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             task_data = dialog.get_data()
-            task_data['id'] = str(uuid.uuid4())
+            task_data['id'] = self._new_id()
             # Place at viewport center
             view_center = self.view.mapToScene(self.view.viewport().rect().center())
             task_data['pos'] = [view_center.x() - 100, view_center.y() - 40]
@@ -447,6 +732,7 @@ class MainWindow(QMainWindow):
             node = TaskNode(task_data, self)
             self.scene.addItem(node)
             self.nodes[task_data['id']] = node
+            self.index_node(node)
             self.save_data()
     
     def delete_task(self, node_to_delete):
@@ -462,7 +748,8 @@ class MainWindow(QMainWindow):
         self.scene.removeItem(node_to_delete)
         if task_id in self.nodes:
             del self.nodes[task_id]
-        
+        self._node_index.remove(task_id)
+
         self.save_data()
         
     def add_connection(self, start_node, end_node):
@@ -471,16 +758,16 @@ class MainWindow(QMainWindow):
         end_id = end_node.task_data['id']
 
         # Prevent duplicate connections
-        for conn in self.connections.values():
-            if (conn.connection_data['from'] == start_id and conn.connection_data['to'] == end_id):
-                return
-        
-        conn_id = str(uuid.uuid4())
+        if (start_id, end_id) in self._conn_by_endpoints:
+            return
+
+        conn_id = self._new_id()
         conn_data = {'id': conn_id, 'from': start_id, 'to': end_id}
-        
+
         line = ConnectionLine(start_node, end_node, conn_data, self)
         self.scene.addItem(line)
         self.connections[conn_id] = line
+        self._conn_by_endpoints[(start_id, end_id)] = conn_id
         self.save_data()
 
     def delete_connection(self, line_to_delete):
@@ -493,11 +780,17 @@ class MainWindow(QMainWindow):
         self.scene.removeItem(line_to_delete)
         if conn_id in self.connections:
             del self.connections[conn_id]
+        self._conn_by_endpoints.pop(
+            (line_to_delete.connection_data['from'], line_to_delete.connection_data['to']), None)
 
         self.save_data()
 
     def save_data(self):
-        """Saves all task and connection data to a JSON file."""
+        """Schedules a save; rapid calls are coalesced into a single write."""
+        self._save_timer.start()
+
+    def _do_save(self):
+        """Serializes the graph and hands the bytes to the save worker."""
         tasks = [node.task_data for node in self.nodes.values()]
         connections = [line.connection_data for line in self.connections.values()]
 
@@ -505,39 +798,72 @@ class MainWindow(QMainWindow):
             "tasks": tasks,
             "connections": connections
         }
-        with open("tasks.json", "w") as f:
-            json.dump(data, f, indent=4)
+        # Compact output (no indent) halves the bytes written
+        if orjson is not None:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data, separators=(',', ':')).encode("utf-8")
+        # If a write is already queued, submit just swaps in the newer payload
+        if not self._save_worker.submit(payload):
+            QMetaObject.invokeMethod(self._save_worker, "save",
+                                     Qt.ConnectionType.QueuedConnection)
 
     def load_data(self):
         """Loads all task and connection data from a JSON file."""
         try:
-            with open("tasks.json", "r") as f:
-                data = json.load(f)
+            with open(SAVE_FILE, "rb") as f:
+                raw = f.read()
         except FileNotFoundError:
             return
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         self.nodes.clear()
         self.connections.clear()
+        self._conn_by_endpoints.clear()
+        self._node_index = NodeGridIndex()
         self.scene.clear()
 
-        # Recreate nodes
-        for task_data in data.get("tasks", []):
-            node = TaskNode(task_data, self)  # pass the dict directly
-            self.nodes[task_data["id"]] = node
-            self.scene.addItem(node)
-    
-        # Recreate connections
-        for conn_data in data.get("connections", []):
-            start_id = conn_data["from"]
-            end_id = conn_data["to"]
-            if start_id in self.nodes and end_id in self.nodes:
-                line = ConnectionLine(self.nodes[start_id], self.nodes[end_id], conn_data, self)
-                self.connections[conn_data["id"]] = line
-                self.scene.addItem(line)
+        # Suspend the spatial index and repaints during the bulk add, so the
+        # BSP tree is built once at the end instead of per addItem call.
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.view.setUpdatesEnabled(False)
+        try:
+            # Recreate nodes
+            for task_data in data.get("tasks", []):
+                node = TaskNode(task_data, self)  # pass the dict directly
+                self.nodes[task_data["id"]] = node
+                self.scene.addItem(node)
+                self.index_node(node)
+
+            # Recreate connections
+            for conn_data in data.get("connections", []):
+                start_id = conn_data["from"]
+                end_id = conn_data["to"]
+                if start_id in self.nodes and end_id in self.nodes:
+                    line = ConnectionLine(self.nodes[start_id], self.nodes[end_id], conn_data, self)
+                    self.connections[conn_data["id"]] = line
+                    self._conn_by_endpoints[(start_id, end_id)] = conn_data["id"]
+                    self.scene.addItem(line)
+        finally:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+            self.view.setUpdatesEnabled(True)
+
+        # Seed the id counter past anything already in the file
+        max_id = 0
+        for record in data.get("tasks", []) + data.get("connections", []):
+            try:
+                max_id = max(max_id, int(record.get("id", 0)))
+            except ValueError:
+                pass # uuid-style id from an older save; leave it be
+        self._next_id = itertools.count(max_id + 1)
     
     def closeEvent(self, event):
         """Handles closing the application."""
-        self.save_data()
+        self._save_timer.stop()
+        self._do_save()
+        self._save_worker.save()  # flush synchronously; queued call then no-ops
+        self._save_thread.quit()
+        self._save_thread.wait()
         event.accept()
 
 